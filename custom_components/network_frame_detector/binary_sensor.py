@@ -9,7 +9,6 @@ from homeassistant.components.binary_sensor import (
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import NetworkFrameDetectorCoordinator
@@ -28,23 +27,30 @@ async def async_setup_entry(
     async_add_entities([NetworkFrameDetectorBinarySensor(coordinator, config_entry)])
 
 
-class NetworkFrameDetectorBinarySensor(
-    CoordinatorEntity[NetworkFrameDetectorCoordinator], BinarySensorEntity
-):
+class NetworkFrameDetectorBinarySensor(BinarySensorEntity):
     """Binary sensor representing network frame detection state."""
 
+    _attr_should_poll = False
+
     def __init__(
         self,
         coordinator: NetworkFrameDetectorCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the binary sensor."""
-        super().__init__(coordinator)
+        self.coordinator = coordinator
         self._config_entry = config_entry
         self._attr_name = config_entry.title
         self._attr_unique_id = config_entry.entry_id
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
 
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to coordinator state updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_listener(self.async_write_ha_state)
+        )
+
     @property
     def is_on(self) -> bool:
         """Return True if frame was detected."""
@@ -37,6 +37,33 @@ from .const import (
     PatternType,
     Protocol,
 )
+from .listener import compile_regex_pattern
+
+# Pre-compiled validators
+_WS_COLON_RE = re.compile(r"[ :]")
+
+# User step schema with defaults, built once at import
+_USER_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_NAME, default=""): str,
+        vol.Required(CONF_PROTOCOL, default=Protocol.UDP): vol.In([Protocol.UDP, Protocol.TCP]),
+        vol.Required(CONF_PORT, default=5353): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
+        vol.Required(CONF_MULTICAST, default=DEFAULT_MULTICAST): bool,
+        vol.Required(CONF_PATTERN_TYPE, default=PatternType.STRING): vol.In([
+            PatternType.STRING,
+            PatternType.REGEX,
+            PatternType.HEX,
+        ]),
+        vol.Required(CONF_PATTERN_VALUE, default=""): str,
+        vol.Required(CONF_COOLDOWN, default=DEFAULT_COOLDOWN): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_COOLDOWN, max=MAX_COOLDOWN)
+        ),
+        vol.Required(CONF_SENSOR_DURATION, default=DEFAULT_SENSOR_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_SENSOR_DURATION, max=MAX_SENSOR_DURATION)
+        ),
+        vol.Optional(CONF_SOURCE_IP, default=""): str,
+    }
+)
 
 
 def validate_name(name: str) -> bool:
@@ -65,19 +92,19 @@ def validate_pattern_value(pattern_type: str, pattern_value: str) -> tuple[bool,
         return False, f"Pattern value exceeds maximum length of {MAX_PATTERN_VALUE_LENGTH}"
 
     if pattern_type == PatternType.HEX:
-        # Hex pattern validation: must be even length and contain only hex characters
-        pattern_clean = pattern_value.strip().replace(" ", "").replace(":", "")
-        if len(pattern_clean) % 2 != 0:
-            return False, "Hex pattern must have even number of characters"
-        if not all(c in "0123456789abcdefABCDEF" for c in pattern_clean):
-            return False, "Hex pattern must contain only hexadecimal characters"
-        # Check decoded length doesn't exceed MAX_PATTERN_LENGTH
-        try:
-            decoded = bytes.fromhex(pattern_clean)
+        # Hex pattern validation: each comma-separated alternative must decode,
+        # bytes.fromhex rejects odd lengths and non-hex characters
+        for part in pattern_value.split(","):
+            pattern_clean = _WS_COLON_RE.sub("", part.strip())
+            try:
+                decoded = bytes.fromhex(pattern_clean)
+            except ValueError:
+                return False, "Invalid hex pattern"
+            if not decoded:
+                return False, "Hex pattern cannot be empty"
+            # Check decoded length doesn't exceed MAX_PATTERN_LENGTH
             if len(decoded) > MAX_PATTERN_LENGTH:
                 return False, f"Decoded hex pattern exceeds maximum length of {MAX_PATTERN_LENGTH} bytes"
-        except ValueError:
-            return False, "Invalid hex pattern format"
 
     elif pattern_type == PatternType.REGEX:
         # Regex validation: check length and compile to catch syntax errors
@@ -85,14 +112,14 @@ def validate_pattern_value(pattern_type: str, pattern_value: str) -> tuple[bool,
             return False, f"Regex pattern exceeds maximum length of {MAX_REGEX_PATTERN_LENGTH}"
         try:
             # Pre-compile to validate syntax and catch ReDoS-prone patterns early
-            # Use timeout-safe compilation (Python 3.11+)
-            compiled = re.compile(pattern_value)
+            # Compiled exactly as the listener will, result is cached for it
+            compile_regex_pattern(pattern_value)
             # Check for obviously dangerous patterns (very long alternations, nested quantifiers)
             # This is a basic check; full ReDoS prevention would require more sophisticated analysis
             if len(pattern_value) > 100 and ("|" in pattern_value or "*" in pattern_value or "+" in pattern_value):
                 # Warn but don't block - user is responsible for safe patterns
                 pass
-        except re.error as e:
+        except (re.error, UnicodeEncodeError) as e:
             return False, f"Invalid regex pattern: {str(e)}"
 
     # String patterns: just check length
@@ -193,32 +220,9 @@ class NetworkFrameDetectorConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=user_input,
                 )
 
-        # Build schema with defaults
-        data_schema = vol.Schema(
-            {
-                vol.Required(CONF_NAME, default=""): str,
-                vol.Required(CONF_PROTOCOL, default=Protocol.UDP): vol.In([Protocol.UDP, Protocol.TCP]),
-                vol.Required(CONF_PORT, default=5353): vol.All(vol.Coerce(int), vol.Range(min=1, max=65535)),
-                vol.Required(CONF_MULTICAST, default=DEFAULT_MULTICAST): bool,
-                vol.Required(CONF_PATTERN_TYPE, default=PatternType.STRING): vol.In([
-                    PatternType.STRING,
-                    PatternType.REGEX,
-                    PatternType.HEX,
-                ]),
-                vol.Required(CONF_PATTERN_VALUE, default=""): str,
-                vol.Required(CONF_COOLDOWN, default=DEFAULT_COOLDOWN): vol.All(
-                    vol.Coerce(float), vol.Range(min=MIN_COOLDOWN, max=MAX_COOLDOWN)
-                ),
-                vol.Required(CONF_SENSOR_DURATION, default=DEFAULT_SENSOR_DURATION): vol.All(
-                    vol.Coerce(float), vol.Range(min=MIN_SENSOR_DURATION, max=MAX_SENSOR_DURATION)
-                ),
-                vol.Optional(CONF_SOURCE_IP, default=""): str,
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -16,6 +16,10 @@ MIN_SENSOR_DURATION: Final = 1  # Minimum sensor ON duration in seconds
 MAX_SENSOR_DURATION: Final = 3600  # Maximum sensor ON duration (1 hour)
 MAX_PATTERN_VALUE_LENGTH: Final = 2048  # Maximum pattern value string length
 
+# UDP receive batching
+UDP_RECEIVE_BATCH: Final = 64  # Maximum datagrams read per socket wakeup
+UDP_RECEIVE_BUFFER_SIZE: Final = 2 * 1024 * 1024  # Socket receive buffer (SO_RCVBUF)
+
 # Regex compilation flags for security
 # re.NOFLAG is Python 3.11+, fallback to 0 for older versions
 import re
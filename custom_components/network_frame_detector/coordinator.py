@@ -2,21 +2,33 @@
 
 from __future__ import annotations
 
-import logging
-from datetime import datetime, timedelta
-from typing import Any
+import time
+from datetime import datetime
+from typing import Any, Callable
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import EVENT_NETWORK_FRAME_DETECTED
 
-_LOGGER = logging.getLogger(__name__)
 
-
-class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Coordinator for managing network frame detection state."""
+class NetworkFrameDetectorCoordinator:
+    """
+    Coordinator for managing network frame detection state.
+    State is pushed by the listener, so no DataUpdateCoordinator
+    refresh machinery is needed, only a list of update listeners.
+    """
+
+    __slots__ = (
+        "hass",
+        "entry_id",
+        "_duration_ns",
+        "_deadline_ns",
+        "_last_detection_ns",
+        "_sensor_state",
+        "_reset_task",
+        "_listeners",
+    )
 
     def __init__(
         self,
@@ -25,17 +37,35 @@ class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         sensor_duration: float,
     ) -> None:
         """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            logger=_LOGGER,
-            name=f"{entry_id}_coordinator",
-            update_interval=None,  # No periodic updates needed
-        )
+        self.hass = hass
         self.entry_id = entry_id
-        self.sensor_duration = timedelta(seconds=sensor_duration)
-        self._last_detection_time: datetime | None = None
+        self._duration_ns = int(sensor_duration * 1_000_000_000)
+        # Monotonic time at which the sensor turns OFF
+        self._deadline_ns = 0
+        # Wall-clock nanoseconds, converted to datetime only when read
+        self._last_detection_ns: int | None = None
         self._sensor_state = False
         self._reset_task: Any = None
+        self._listeners: list[Callable[[], None]] = []
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for state updates, returns a callable to remove the listener."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            """Remove update listener."""
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify all listeners of a state change."""
+        for update_callback in self._listeners:
+            update_callback()
 
     @callback
     def on_detection(self) -> None:
@@ -43,8 +73,8 @@ class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         Called when a frame is detected.
         Updates sensor state and fires event.
         """
-        now = datetime.now()
-        self._last_detection_time = now
+        now_ns = time.time_ns()
+        self._last_detection_ns = now_ns
         self._sensor_state = True
 
         # Fire event
@@ -52,7 +82,8 @@ class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             EVENT_NETWORK_FRAME_DETECTED,
             {
                 "entry_id": self.entry_id,
-                "detection_time": now.isoformat(),
+                "detection_time": self.last_detection.isoformat(),
+                "detection_time_ns": now_ns,
             },
         )
 
@@ -64,21 +95,33 @@ class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     @callback
     def _schedule_sensor_reset(self) -> None:
-        """Schedule sensor state to reset after duration."""
-        # Cancel any existing reset task
-        if self._reset_task:
-            self._reset_task()
-
-        # Schedule new reset using Home Assistant's async_call_later
-        self._reset_task = async_call_later(
-            self.hass,
-            self.sensor_duration.total_seconds(),
-            self._reset_sensor_state,
-        )
+        """
+        Schedule sensor state to reset after duration.
+        Only the deadline moves on repeated detections, the pending
+        timer re-arms itself for the remainder when it fires early.
+        """
+        self._deadline_ns = time.monotonic_ns() + self._duration_ns
+        if self._reset_task is None:
+            # Schedule reset using Home Assistant's async_call_later
+            self._reset_task = async_call_later(
+                self.hass,
+                self._duration_ns / 1_000_000_000,
+                self._reset_sensor_state,
+            )
 
     @callback
     def _reset_sensor_state(self, _now: datetime) -> None:
-        """Reset sensor state to OFF."""
+        """Reset sensor state to OFF once the deadline has passed."""
+        remaining_ns = self._deadline_ns - time.monotonic_ns()
+        if remaining_ns > 0:
+            # Detections extended the deadline since the timer was armed
+            self._reset_task = async_call_later(
+                self.hass,
+                remaining_ns / 1_000_000_000,
+                self._reset_sensor_state,
+            )
+            return
+
         self._sensor_state = False
         self._reset_task = None
         self.async_update_listeners()
@@ -91,12 +134,13 @@ class NetworkFrameDetectorCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     @property
     def last_detection(self) -> datetime | None:
         """Return last detection time."""
-        return self._last_detection_time
+        if self._last_detection_ns is None:
+            return None
+        return datetime.fromtimestamp(self._last_detection_ns / 1_000_000_000)
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator and cancel tasks."""
         if self._reset_task:
             self._reset_task()
             self._reset_task = None
-        await super().async_shutdown()
-
+        self._listeners.clear()
@@ -3,14 +3,28 @@
 from __future__ import annotations
 
 import asyncio
+import ctypes
+import functools
 import ipaddress
 import re
 import socket
-from datetime import datetime, timedelta
-from typing import Callable, Pattern
+import struct
+import sys
+import time
+from typing import Callable, Iterator, Pattern
 
 from homeassistant.core import HomeAssistant
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import hyperscan
+except ImportError:  # Optional accelerator, fall back to the re module
+    hyperscan = None
+
 from .const import (
     CONF_COOLDOWN,
     CONF_MULTICAST,
@@ -24,8 +38,139 @@ from .const import (
     PatternType,
     Protocol,
     REGEX_FLAGS,
+    UDP_RECEIVE_BATCH,
+    UDP_RECEIVE_BUFFER_SIZE,
 )
 
+# Classic BPF opcodes and offsets used by the in-kernel source IP filter
+_BPF_LD_W_ABS = 0x20  # BPF_LD | BPF_W | BPF_ABS
+_BPF_JEQ_K = 0x15  # BPF_JMP | BPF_JEQ | BPF_K
+_BPF_RET_K = 0x06  # BPF_RET | BPF_K
+_SKF_NET_OFF = -0x100000  # Offset of the network (IP) header
+_IPV4_SOURCE_OFFSET = 12
+_SO_ATTACH_FILTER = getattr(socket, "SO_ATTACH_FILTER", 26)
+
+# Regex source that Python's re and PCRE (Hyperscan) read differently:
+# "{,n}" is a 0-n repeat in re but literal text in PCRE, "[:" may open a
+# POSIX class in PCRE. Escaped forms are matched too, erring towards re.
+_PCRE_DIVERGENT_SYNTAX = re.compile(rb"\{,|\[:")
+
+
+@functools.lru_cache(maxsize=128)
+def compile_regex_pattern(pattern_value: str) -> Pattern[bytes]:
+    """
+    Compile a user-supplied regex for bytes matching.
+    Cached so the config flow validator and the listener share the result.
+    Raises re.error or UnicodeEncodeError for invalid patterns.
+    """
+    return re.compile(pattern_value.encode("utf-8"), REGEX_FLAGS)
+
+
+def _parse_regex(pattern: Pattern[bytes]) -> sre_parse.SubPattern | None:
+    """Parse a compiled regex with the re module's own parser."""
+    try:
+        return sre_parse.parse(pattern.pattern, pattern.flags)
+    except Exception:
+        return None
+
+
+def _iter_regex_ops(items: sre_parse.SubPattern) -> Iterator[tuple]:
+    """Yield every (op, av) of a parsed regex, including nested ones."""
+    for op, av in items:
+        yield op, av
+        yield from _iter_nested_ops(av)
+
+
+def _iter_nested_ops(av: object) -> Iterator[tuple]:
+    """Yield the (op, av) of sub-patterns found in an operand."""
+    if isinstance(av, sre_parse.SubPattern):
+        yield from _iter_regex_ops(av)
+    elif isinstance(av, (list, tuple)):
+        for item in av:
+            yield from _iter_nested_ops(item)
+
+
+def hyperscan_compatible(pattern: Pattern[bytes]) -> bool:
+    """
+    Check if Hyperscan would match the regex exactly like the re module.
+    Hyperscan uses PCRE syntax, patterns relying on constructs that differ
+    (\\Z, {,n}, POSIX classes, verbose mode) must stay on re.
+    """
+    if pattern.flags & re.VERBOSE:
+        return False
+    if _PCRE_DIVERGENT_SYNTAX.search(pattern.pattern):
+        return False
+
+    parsed = _parse_regex(pattern)
+    if parsed is None:
+        return False
+
+    for op, av in _iter_regex_ops(parsed):
+        # \Z is the absolute end in re, PCRE also matches before a final newline
+        if op is sre_parse.AT and av is sre_parse.AT_END_STRING:
+            return False
+    return True
+
+
+def required_literal(pattern: Pattern[bytes]) -> bytes | None:
+    """
+    Return the longest literal every match of the regex must contain.
+    Only top-level literal runs are considered, returns None when the
+    regex has none or matches case-insensitively.
+    """
+    if pattern.flags & re.IGNORECASE:
+        return None
+
+    parsed = _parse_regex(pattern)
+    if parsed is None:
+        return None
+
+    longest = b""
+    run = bytearray()
+    for op, av in parsed:
+        if op is sre_parse.LITERAL:
+            run.append(av)
+            continue
+        if len(run) > len(longest):
+            longest = bytes(run)
+        run.clear()
+    if len(run) > len(longest):
+        longest = bytes(run)
+
+    return longest or None
+
+
+def attach_source_ip_filter(
+    sock: socket.socket, source_ip: ipaddress.IPv4Address
+) -> bool:
+    """
+    Attach a classic BPF program dropping datagrams from other sources.
+    Filtered datagrams never reach userspace. Linux only, returns False
+    when the filter could not be attached.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+
+    instructions = (
+        # A = IPv4 source address (kernel converts to host byte order)
+        (_BPF_LD_W_ABS, 0, 0, (_SKF_NET_OFF + _IPV4_SOURCE_OFFSET) & 0xFFFFFFFF),
+        # Accept if A == source_ip, otherwise drop
+        (_BPF_JEQ_K, 0, 1, int(source_ip)),
+        (_BPF_RET_K, 0, 0, 0xFFFFFFFF),
+        (_BPF_RET_K, 0, 0, 0),
+    )
+    program = ctypes.create_string_buffer(
+        b"".join(struct.pack("HBBI", *insn) for insn in instructions)
+    )
+    # struct sock_fprog, the kernel copies the program during setsockopt
+    fprog = struct.pack("HP", len(instructions), ctypes.addressof(program))
+
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, _SO_ATTACH_FILTER, fprog)
+    except OSError:
+        return False
+    return True
+
 
 class SecureNetworkListener:
     """
@@ -46,22 +191,36 @@ class SecureNetworkListener:
         config: dict,
         on_detection: Callable[[], None],
     ) -> None:
-        """Initialize the secure network listener."""
+        """
+        Initialize the secure network listener.
+        on_detection must be a @callback, it is invoked from the event loop.
+        """
         self.hass = hass
         self.config = config
         self.on_detection = on_detection
         self._socket: socket.socket | None = None
-        self._transport: asyncio.DatagramTransport | None = None
+        # Reused UDP receive buffer, avoids a bytes allocation per datagram
+        self._rx_buf = bytearray(MAX_PAYLOAD_INSPECTION)
         self._server: asyncio.Server | None = None
         self._running = False
-        self._last_detection: datetime | None = None
-        self._cooldown = timedelta(seconds=config.get(CONF_COOLDOWN, 5))
+        # Monotonic nanoseconds, immune to wall-clock changes
+        self._last_detection_ns: int | None = None
+        self._cooldown_ns = int(config.get(CONF_COOLDOWN, 5) * 1_000_000_000)
         
+        # Literal every regex match must contain, checked before the regex
+        self._prefilter: bytes | None = None
+
+        # Optional Hyperscan database for regex patterns
+        self._hs_database = None
+        self._hs_scratch = None
+
         # Compile pattern based on type
         self._pattern = self._compile_pattern(
             config.get(CONF_PATTERN_TYPE, PatternType.STRING),
             config.get(CONF_PATTERN_VALUE, ""),
         )
+        # Matcher specialized once for the compiled pattern type
+        self._matches_pattern = self._select_matcher()
         
         # Optional source IP filter
         source_ip_str = config.get(CONF_SOURCE_IP)
@@ -72,13 +231,18 @@ class SecureNetworkListener:
                 self._source_ip_filter = None
         else:
             self._source_ip_filter = None
+        # Canonical string form, compared directly against peer addresses
+        self._source_ip_str: str | None = (
+            str(self._source_ip_filter) if self._source_ip_filter else None
+        )
 
     def _compile_pattern(
         self, pattern_type: str, pattern_value: str
-    ) -> bytes | Pattern[bytes] | None:
+    ) -> bytes | tuple[bytes, ...] | Pattern[bytes] | None:
         """
         Compile pattern for matching.
-        Returns bytes for string/hex patterns, compiled regex for regex patterns.
+        Returns bytes for string/hex patterns, a tuple of bytes for hex
+        alternatives, compiled regex for regex patterns.
         """
         if not pattern_value:
             return None
@@ -92,95 +256,208 @@ class SecureNetworkListener:
 
         elif pattern_type == PatternType.HEX:
             # Hex pattern: decode hex string to bytes
-            pattern_clean = pattern_value.strip().replace(" ", "").replace(":", "")
-            try:
-                return bytes.fromhex(pattern_clean)
-            except ValueError:
-                return None
+            # Comma-separated values are alternatives, any of them matches
+            needles = []
+            for part in pattern_value.split(","):
+                pattern_clean = part.strip().replace(" ", "").replace(":", "")
+                try:
+                    needle = bytes.fromhex(pattern_clean)
+                except ValueError:
+                    return None
+                if needle:
+                    needles.append(needle)
+            if len(needles) > 1:
+                return tuple(needles)
+            return needles[0] if needles else None
 
         elif pattern_type == PatternType.REGEX:
             # Regex pattern: compile with safe flags
             try:
                 # Compile regex pattern for bytes matching
-                return re.compile(pattern_value.encode("utf-8"), REGEX_FLAGS)
+                compiled = compile_regex_pattern(pattern_value)
             except (re.error, UnicodeEncodeError):
                 return None
+            self._prefilter = required_literal(compiled)
+            self._compile_hyperscan(compiled)
+            return compiled
 
         return None
 
-    def _matches_pattern(self, payload: bytes) -> bool:
+    def _compile_hyperscan(self, pattern: Pattern[bytes]) -> None:
+        """
+        Compile regex into a Hyperscan block-mode database when available.
+        Patterns Hyperscan cannot handle (backreferences, lookarounds...)
+        or would match differently silently keep using the re module.
+        """
+        if hyperscan is None or not hyperscan_compatible(pattern):
+            return
+
+        try:
+            database = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+            database.compile(
+                expressions=[pattern.pattern],
+                ids=[0],
+                elements=1,
+                flags=[hyperscan.HS_FLAG_SINGLEMATCH],
+            )
+            scratch = hyperscan.Scratch(database)
+        except hyperscan.error:
+            return
+
+        self._hs_database = database
+        self._hs_scratch = scratch
+
+    def _select_matcher(self) -> Callable[..., bool]:
         """
-        Check if payload matches the configured pattern.
+        Return the matcher for the compiled pattern.
+        Matchers take (payload, end) and inspect only payload[:end],
+        end must not exceed MAX_PAYLOAD_INSPECTION.
         Security: Only inspects up to MAX_PAYLOAD_INSPECTION bytes.
         """
         if not self._pattern:
+            return self._match_none
+        if isinstance(self._pattern, bytes):
+            return self._match_bytes
+        if isinstance(self._pattern, tuple):
+            return self._match_any_bytes
+        if self._hs_database is not None:
+            return self._match_hyperscan
+        return self._match_regex
+
+    def _match_none(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Never match, used when no valid pattern is configured."""
+        return False
+
+    def _match_bytes(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Match a single byte pattern (string/hex)."""
+        # Bounded by find's end argument so the inspected window is
+        # searched without copying it
+        return payload.find(self._pattern, 0, end) != -1
+
+    def _match_any_bytes(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Match if any of the hex alternatives is present."""
+        return any(payload.find(needle, 0, end) != -1 for needle in self._pattern)
+
+    def _match_hyperscan(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Match the regex with Hyperscan, reports at most one match per scan."""
+        # Reject payloads missing the regex's required literal early
+        if not self._passes_prefilter(payload, end):
             return False
 
-        # Limit payload inspection to prevent memory exhaustion
-        limited_payload = payload[:MAX_PAYLOAD_INSPECTION]
+        matched = False
 
-        if isinstance(self._pattern, bytes):
-            # Simple byte pattern matching
-            return self._pattern in limited_payload
+        def _on_match(*_args: object) -> None:
+            nonlocal matched
+            matched = True
 
-        elif isinstance(self._pattern, Pattern):
-            # Regex pattern matching
-            # Use search with timeout protection (Python 3.11+)
-            try:
-                return bool(self._pattern.search(limited_payload))
-            except Exception:
-                # Catch any regex exceptions (shouldn't happen with pre-compiled patterns)
-                return False
+        # Hyperscan needs a read-only buffer, copy the inspected window
+        # unless the payload is already bytes and fits in it
+        if isinstance(payload, bytes) and len(payload) <= end:
+            window = payload
+        else:
+            window = bytes(memoryview(payload)[:end])
 
-        return False
+        try:
+            self._hs_database.scan(
+                window,
+                match_event_handler=_on_match,
+                scratch=self._hs_scratch,
+            )
+        except hyperscan.error:
+            return False
+        return matched
+
+    def _match_regex(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Match the regex with the re module."""
+        # Reject payloads missing the regex's required literal early
+        if not self._passes_prefilter(payload, end):
+            return False
+
+        # Use search with timeout protection (Python 3.11+)
+        try:
+            # Limit payload inspection to prevent memory exhaustion,
+            # endpos bounds the search exactly like a slice without copying
+            return bool(self._pattern.search(payload, 0, end))
+        except Exception:
+            # Catch any regex exceptions (shouldn't happen with pre-compiled patterns)
+            return False
+
+    def _passes_prefilter(
+        self, payload: bytes | bytearray, end: int = MAX_PAYLOAD_INSPECTION
+    ) -> bool:
+        """Check if payload[:end] contains the literal required by the regex."""
+        return (
+            self._prefilter is None
+            or payload.find(self._prefilter, 0, end) != -1
+        )
 
     def _check_cooldown(self) -> bool:
         """Check if cooldown period has elapsed."""
-        if self._last_detection is None:
+        if self._last_detection_ns is None:
             return True
-        return datetime.now() - self._last_detection >= self._cooldown
+        return time.monotonic_ns() - self._last_detection_ns >= self._cooldown_ns
 
     def _handle_udp_datagram(
-        self, data: bytes, addr: tuple[str, int]
-    ) -> None:
+        self, data: bytearray, size: int, addr: tuple[str, int]
+    ) -> bool:
         """
-        Handle incoming UDP datagram.
+        Check an incoming UDP datagram, return True if it is a detection.
+        The datagram is the first size bytes of the receive buffer.
         Security: Only processes data, never modifies or forwards it.
         """
         if not self._running:
-            return
+            return False
 
         # Check cooldown
         if not self._check_cooldown():
-            return
+            return False
 
         # Optional source IP filtering
-        if self._source_ip_filter is not None:
-            try:
-                source_ip = ipaddress.ip_address(addr[0])
-                if source_ip != self._source_ip_filter:
-                    return
-            except ValueError:
-                # Invalid source IP, ignore
-                return
+        if self._source_ip_str is not None and addr[0] != self._source_ip_str:
+            return False
 
         # Check pattern match
-        if self._matches_pattern(data):
-            self._last_detection = datetime.now()
-            # Schedule callback in event loop
-            # async_run_job already schedules the callback, no need to wrap in create_task
-            self.hass.async_run_job(self.on_detection)
-
-    class _UDPProtocol(asyncio.DatagramProtocol):
-        """UDP protocol handler for secure frame detection."""
-        
-        def __init__(self, listener: SecureNetworkListener) -> None:
-            """Initialize protocol with listener reference."""
-            self._listener = listener
-        
-        def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
-            """Handle received datagram."""
-            self._listener._handle_udp_datagram(data, addr)
+        return self._matches_pattern(data, size)
+
+    def _udp_ready(self) -> None:
+        """
+        Drain pending UDP datagrams when the socket becomes readable.
+        Reads up to UDP_RECEIVE_BATCH datagrams per wakeup and reports
+        at most one detection per batch.
+        """
+        if self._socket is None:
+            return
+
+        detected = False
+        for _ in range(UDP_RECEIVE_BATCH):
+            try:
+                # Datagrams longer than the buffer are truncated by the
+                # kernel, nothing past MAX_PAYLOAD_INSPECTION is inspected
+                size, addr = self._socket.recvfrom_into(self._rx_buf)
+            except (BlockingIOError, InterruptedError):
+                break
+            except OSError:
+                # Socket error, wait for the next readiness notification
+                break
+
+            # Remaining datagrams are only drained once a match is found
+            if not detected:
+                detected = self._handle_udp_datagram(self._rx_buf, size, addr)
+
+        if detected:
+            self._last_detection_ns = time.monotonic_ns()
+            # on_detection is a @callback, call it inline on the event loop
+            self.on_detection()
 
     async def _tcp_connection_handler(
         self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
@@ -195,34 +472,25 @@ class SecureNetworkListener:
             return
 
         try:
+            # Optional source IP filtering, checked before reading any data
+            if self._source_ip_str is not None:
+                peer_addr = writer.get_extra_info("peername")
+                if peer_addr and peer_addr[0] != self._source_ip_str:
+                    # Connection is closed in the finally block
+                    return
+
             # Read data with size limit
             data = await asyncio.wait_for(
                 reader.read(MAX_PAYLOAD_INSPECTION),
                 timeout=1.0,  # Timeout to prevent hanging
             )
 
-            # Optional source IP filtering
-            if self._source_ip_filter is not None:
-                try:
-                    peer_addr = writer.get_extra_info("peername")
-                    if peer_addr:
-                        source_ip = ipaddress.ip_address(peer_addr[0])
-                        if source_ip != self._source_ip_filter:
-                            writer.close()
-                            await writer.wait_closed()
-                            return
-                except (ValueError, TypeError):
-                    # Invalid source IP, close connection
-                    writer.close()
-                    await writer.wait_closed()
-                    return
-
             # Check pattern match
             if data and self._matches_pattern(data):
                 if self._check_cooldown():
-                    self._last_detection = datetime.now()
-                    # async_run_job already schedules the callback
-                    self.hass.async_run_job(self.on_detection)
+                    self._last_detection_ns = time.monotonic_ns()
+                    # on_detection is a @callback, call it inline on the event loop
+                    self.on_detection()
 
         except asyncio.TimeoutError:
             # Timeout is expected for TCP connections
@@ -255,7 +523,20 @@ class SecureNetworkListener:
                 
                 # Security: Bind only to specified port, never promiscuous mode
                 sock.bind(("", port))
-                
+
+                # Larger receive buffer to absorb bursts, capped by the kernel
+                try:
+                    sock.setsockopt(
+                        socket.SOL_SOCKET, socket.SO_RCVBUF, UDP_RECEIVE_BUFFER_SIZE
+                    )
+                except OSError:
+                    pass
+
+                # Drop datagrams from other sources in the kernel when possible,
+                # the userspace check in _handle_udp_datagram still applies
+                if isinstance(self._source_ip_filter, ipaddress.IPv4Address):
+                    attach_source_ip_filter(sock, self._source_ip_filter)
+
                 # Set multicast options if needed
                 if multicast:
                     # Join multicast group (for mDNS, etc.)
@@ -263,16 +544,10 @@ class SecureNetworkListener:
                     mreq = socket.inet_aton("224.0.0.251") + socket.inet_aton("0.0.0.0")
                     sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
 
-                # Create transport with secure protocol
-                loop = asyncio.get_event_loop()
-                protocol = self._UDPProtocol(self)
-                transport, _ = await loop.create_datagram_endpoint(
-                    lambda: protocol,
-                    sock=sock,
-                )
-
-                self._transport = transport
+                # Read datagrams in batches directly from the event loop
+                sock.setblocking(False)
                 self._socket = sock
+                self.hass.loop.add_reader(sock.fileno(), self._udp_ready)
                 self._running = True
 
             elif protocol == Protocol.TCP:
@@ -293,11 +568,11 @@ class SecureNetworkListener:
         """Stop the listener and clean up resources."""
         self._running = False
 
-        if self._transport:
-            self._transport.close()
-            self._transport = None
-
         if self._socket:
+            try:
+                self.hass.loop.remove_reader(self._socket.fileno())
+            except Exception:
+                pass
             try:
                 self._socket.close()
             except Exception: